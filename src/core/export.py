@@ -0,0 +1,29 @@
+# src/core/export.py
+
+# Responsible for writing finished artwork to disk.
+
+from pathlib import Path
+from PIL import Image
+
+def save_image(
+    image: Image.Image,
+    output_path: str,
+    fast_encode: bool = False,
+) -> None:
+    """
+    Save image with encoder settings suited to the output format.
+    `fast_encode` trades larger PNG files for a quicker zlib pass.
+    """
+
+    suffix = Path(output_path).suffix.lower()
+    save_kwargs = {}
+
+    if suffix == ".png":
+        # Lossless either way; level 1 encodes faster but compresses less
+        save_kwargs["compress_level"] = 1 if fast_encode else 6
+    elif suffix in (".jpg", ".jpeg"):
+        # Poster quality: sharper dots than Pillow's default of 75, at the
+        # cost of larger files and a slower encode
+        save_kwargs["quality"] = 95
+
+    image.save(output_path, **save_kwargs)
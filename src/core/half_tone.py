@@ -10,9 +10,60 @@ from config import (
     DOT_COLOR,
 )
 
+def _cell_means(brightness_map: np.ndarray, cell_size: int) -> np.ndarray:
+    """
+    Average brightness of every cell on the sampling grid, in one pass.
+    Partial cells along the right/bottom edges are averaged over the
+    pixels they actually contain. Means are in [0, 1] for both float
+    maps and 8-bit (0-255) maps.
+    """
+
+    height, width = brightness_map.shape
+    row_starts = np.arange(0, height, cell_size)
+    col_starts = np.arange(0, width, cell_size)
+
+    # sum rows within each band, then columns within each cell
+    sums = np.add.reduceat(brightness_map, row_starts, axis=0, dtype=np.float64)
+    sums = np.add.reduceat(sums, col_starts, axis=1)
+
+    # pixel count per cell (only edge cells differ from cell_size**2)
+    rows = np.minimum(cell_size, height - row_starts)
+    cols = np.minimum(cell_size, width - col_starts)
+
+    sums /= np.outer(rows, cols)
+
+    # 8-bit maps: sums above are exact, rescale once on the small grid
+    if brightness_map.dtype == np.uint8:
+        sums /= 255.0
+
+    return sums
+
+def _compute_radii(
+    brightness_map: np.ndarray,
+    cell_size: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Grid positions (row, col) and radii of every dot that survives
+    thresholding.
+    """
+
+    means = _cell_means(brightness_map, cell_size)
+
+    # skip highlights and empty dots
+    keep = (means <= BRIGHTNESS_THRESHOLD) & (means < 1)
+
+    # map brightness -> radius, reusing the means buffer
+    radii = np.subtract(1, means, out=means)
+    radii *= MAX_DOT_RADIUS
+
+    rows, cols = np.nonzero(keep)
+
+    return rows, cols, radii[rows, cols]
+
 def generate_dot_halftone(brightness_map: np.ndarray) -> Image.Image:
     """
-    Generate a classic dot halftone image from brightness map.
+    Generate a classic dot halftone image from brightness map
+    (float in [0, 1] or uint8 in [0, 255]).
     """
 
     height, width = brightness_map.shape
@@ -21,40 +72,20 @@ def generate_dot_halftone(brightness_map: np.ndarray) -> Image.Image:
     canvas = Image.new("RGB", (width, height), BACKGROUND_COLOR)
     draw = ImageDraw.Draw(canvas)
 
-    # Loop over sampling grid
-    for y in range(0, height, CELL_SIZE):
-        for x in range(0, width, CELL_SIZE):
-
-            # extract cell
-            cell = brightness_map[y:y+CELL_SIZE, x:x+CELL_SIZE]
-            if cell.size == 0:
-                continue
-
-            # convert numpy scalar -> python float
-            b: float = float(np.mean(cell))
-
-            # skip highlights
-            if b > BRIGHTNESS_THRESHOLD:
-                continue
-
-            # map brightness -> radius
-            radius: float = float(MAX_DOT_RADIUS * (1 -b))
-            if radius <= 0:
-                continue
-
-            # Dot center
-            cx: float = float(x + CELL_SIZE // 2)
-            cy: float = float(y + CELL_SIZE // 2)
-
-            # draw dot
-            draw.ellipse(
-                (
-                    cx - radius,
-                    cy - radius,
-                    cx + radius,
-                    cy + radius,
-                ),
-                fill=DOT_COLOR
-            )
-    
-    return canvas
\ No newline at end of file
+    rows, cols, radius = _compute_radii(brightness_map, CELL_SIZE)
+
+    # Dot centers
+    cx = cols * CELL_SIZE + CELL_SIZE // 2
+    cy = rows * CELL_SIZE + CELL_SIZE // 2
+
+    # build every bounding box in one pass; ImageDraw's C rasterizer
+    # outpaced cv2.circle and NumPy disc stamping for these small dots
+    boxes = np.stack(
+        (cx - radius, cy - radius, cx + radius, cy + radius), axis=1
+    )
+
+    # draw dots
+    for box in boxes.tolist():
+        draw.ellipse(box, fill=DOT_COLOR)
+
+    return canvas
@@ -6,29 +6,33 @@ import cv2
 import numpy as np
 from config import TARGET_WIDTH, GAMMMA
 
+# Gamma curve for every 8-bit gray level, kept 8-bit.
+# Built once at import so each image costs a single lookup.
+_GAMMA_LUT = np.round(
+    np.power(np.arange(256) / 255.0, GAMMMA) * 255.0
+).astype(np.uint8)
+
 def preprocess_image(image_path: str) -> np.ndarray:
     """
-    Load image, normalise contrast, and return grayscale
-    values in range [0, 1]
+    Load image, normalise contrast, and return 8-bit grayscale
+    brightness (0 = black, 255 = white)
     """
 
-    # Load image
-    img = cv2.imread(image_path)
-    if img is None:
+    # Load image straight to grayscale: the decoder skips colour
+    # conversion and the resize below touches one channel, not three
+    gray = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+    if gray is None:
         raise ValueError("Image not found or could not be loaded.")
     
     # Resize while keeping aspect ratio
-    h, w = img.shape[:2]
+    h, w = gray.shape[:2]
     scale = TARGET_WIDTH / w
-    img = cv2.resize(img, (TARGET_WIDTH, int(h * scale)))
-
-    # Convert to grayscale
-    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
-
-    # Normalise to [0, 1]
-    gray = gray.astype(np.float32) / 255.0
+    gray = cv2.resize(gray, (TARGET_WIDTH, int(h * scale)))
 
-    # Gamma correction (contrast sculpting)
-    gray = np.power(gray, GAMMMA)
+    # Gamma correction (contrast sculpting); staying uint8 keeps the
+    # map a quarter the size of float32 on its way to the halftone.
+    # A gamma of 1.0 is the identity, so skip the pass entirely.
+    if GAMMMA != 1.0:
+        gray = cv2.LUT(gray, _GAMMA_LUT)
 
     return gray
@@ -1,21 +1,30 @@
 # src/main.py
 
 import argparse
-from core.pre_processing import preprocess_image
-from core.half_tone import generate_dot_halftone
 
 def main():
     parser = argparse.ArgumentParser(description="Mamba Mentality Halftone Generator")
     parser.add_argument("--input", required=True, help="Path to input image")
     parser.add_argument("--output", default="output/halftone.png", help="Output file")
+    parser.add_argument(
+        "--fast-encode",
+        action="store_true",
+        help="Faster PNG encoding at the cost of larger files",
+    )
 
     args = parser.parse_args()
 
+    # Deferred so --help and argument errors return without loading
+    # OpenCV, NumPy and Pillow
+    from core.pre_processing import preprocess_image
+    from core.half_tone import generate_dot_halftone
+    from core.export import save_image
+
     brightness_map = preprocess_image(args.input)
     halftone_img = generate_dot_halftone(brightness_map)
-    halftone_img.save(args.output)
+    save_image(halftone_img, args.output, fast_encode=args.fast_encode)
 
     print(f"Halftone image saved to {args.output}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# Modules under src/ import each other as top-level packages
+# (e.g. `from config import ...`), mirroring how src/main.py runs.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
@@ -0,0 +1,82 @@
+import sys
+
+import numpy as np
+from PIL import Image
+
+import main
+from core import export
+from core.export import save_image
+from core.half_tone import generate_dot_halftone
+
+
+def make_halftone() -> Image.Image:
+    rng = np.random.default_rng(0)
+    brightness_map = rng.integers(0, 256, size=(120, 96), dtype=np.uint8)
+    return generate_dot_halftone(brightness_map)
+
+
+def test_png_round_trips_with_and_without_fast_encode(tmp_path):
+    image = make_halftone()
+    default_path = tmp_path / "default.png"
+    fast_path = tmp_path / "fast.png"
+
+    save_image(image, str(default_path))
+    save_image(image, str(fast_path), fast_encode=True)
+
+    for path in (default_path, fast_path):
+        with Image.open(path) as saved:
+            assert np.array_equal(np.asarray(saved), np.asarray(image))
+    assert fast_path.stat().st_size >= default_path.stat().st_size
+
+
+def test_uppercase_jpg_suffix_writes_jpeg(tmp_path):
+    image = make_halftone()
+    output_path = tmp_path / "poster.JPG"
+
+    save_image(image, str(output_path))
+
+    with Image.open(output_path) as saved:
+        assert saved.format == "JPEG"
+        assert saved.size == image.size
+
+
+def test_encoder_kwargs_per_format(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        Image.Image, "save", lambda self, path, **kwargs: calls.append(kwargs)
+    )
+    image = make_halftone()
+
+    save_image(image, str(tmp_path / "a.png"))
+    save_image(image, str(tmp_path / "b.png"), fast_encode=True)
+    save_image(image, str(tmp_path / "c.jpeg"))
+    save_image(image, str(tmp_path / "d.bmp"))
+
+    assert calls == [
+        {"compress_level": 6},
+        {"compress_level": 1},
+        {"quality": 95},
+        {},
+    ]
+
+
+def test_cli_fast_encode_flag_reaches_save_image(tmp_path, monkeypatch):
+    input_path = tmp_path / "portrait.png"
+    make_halftone().save(input_path)
+    calls = []
+    monkeypatch.setattr(
+        export,
+        "save_image",
+        lambda image, path, fast_encode=False: calls.append((path, fast_encode)),
+    )
+
+    for extra_args, expected in (([], False), (["--fast-encode"], True)):
+        output_path = str(tmp_path / "out.png")
+        monkeypatch.setattr(
+            sys,
+            "argv",
+            ["main.py", "--input", str(input_path), "--output", output_path]
+            + extra_args,
+        )
+        main.main()
+        assert calls.pop() == (output_path, expected)
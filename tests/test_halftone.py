@@ -0,0 +1,57 @@
+import numpy as np
+
+from config import CELL_SIZE, MAX_DOT_RADIUS, BACKGROUND_COLOR, DOT_COLOR
+from core.half_tone import _cell_means, _compute_radii, generate_dot_halftone
+
+
+def test_cell_means_match_per_cell_mean():
+    rng = np.random.default_rng(0)
+    brightness_map = rng.random((50, 37)).astype(np.float32)
+
+    means = _cell_means(brightness_map, CELL_SIZE)
+
+    assert means.shape == (5, 4)
+    for row in range(means.shape[0]):
+        for col in range(means.shape[1]):
+            y, x = row * CELL_SIZE, col * CELL_SIZE
+            cell = brightness_map[y:y + CELL_SIZE, x:x + CELL_SIZE]
+            assert np.isclose(means[row, col], np.mean(cell), atol=1e-6)
+
+
+def test_white_image_has_no_dots():
+    brightness_map = np.ones((48, 48), dtype=np.float32)
+
+    canvas = np.asarray(generate_dot_halftone(brightness_map))
+
+    assert (canvas == BACKGROUND_COLOR).all()
+
+
+def test_black_image_has_dot_in_every_cell():
+    brightness_map = np.zeros((48, 48), dtype=np.float32)
+
+    canvas = np.asarray(generate_dot_halftone(brightness_map))
+
+    centers = canvas[CELL_SIZE // 2::CELL_SIZE, CELL_SIZE // 2::CELL_SIZE]
+    assert centers.shape[:2] == (4, 4)
+    assert (centers == DOT_COLOR).all()
+
+
+def test_compute_radii_skips_highlights():
+    brightness_map = np.zeros((24, 24), dtype=np.float32)
+    brightness_map[:CELL_SIZE, :CELL_SIZE] = 1.0
+
+    rows, cols, radii = _compute_radii(brightness_map, CELL_SIZE)
+
+    assert sorted(zip(rows.tolist(), cols.tolist())) == [(0, 1), (1, 0), (1, 1)]
+    assert np.allclose(radii, MAX_DOT_RADIUS)
+
+
+def test_uint8_map_matches_float_map():
+    rng = np.random.default_rng(1)
+    brightness_u8 = rng.integers(0, 256, size=(60, 72), dtype=np.uint8)
+    brightness_f = brightness_u8.astype(np.float64) / 255.0
+
+    assert np.allclose(
+        _cell_means(brightness_u8, CELL_SIZE),
+        _cell_means(brightness_f, CELL_SIZE),
+    )
@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from config import TARGET_WIDTH, GAMMMA
+from core import pre_processing
+from core.pre_processing import preprocess_image
+
+
+def write_gray_image(path: Path, height: int, width: int, seed: int = 0) -> str:
+    rng = np.random.default_rng(seed)
+    image = rng.integers(0, 256, size=(height, width), dtype=np.uint8)
+    cv2.imwrite(str(path), image)
+    return str(path)
+
+
+def test_missing_file_raises_value_error(tmp_path):
+    with pytest.raises(ValueError):
+        preprocess_image(str(tmp_path / "missing.png"))
+
+
+def test_returns_uint8_map_at_target_width(tmp_path):
+    image_path = write_gray_image(tmp_path / "portrait.png", 40, 30)
+
+    brightness_map = preprocess_image(image_path)
+
+    assert brightness_map.dtype == np.uint8
+    assert brightness_map.shape == (int(40 * TARGET_WIDTH / 30), TARGET_WIDTH)
+
+
+def test_each_call_returns_a_private_writable_map(tmp_path):
+    image_path = write_gray_image(tmp_path / "portrait.png", 40, 30)
+
+    first = preprocess_image(image_path)
+    second = preprocess_image(image_path)
+    first[0, 0] = 255 - first[0, 0]
+
+    assert first.flags.writeable
+    assert not np.shares_memory(first, second)
+
+
+def test_gamma_lut_matches_power_curve():
+    levels = np.arange(256)
+    expected = np.power(levels / 255.0, GAMMMA) * 255.0
+
+    lut = pre_processing._GAMMA_LUT
+
+    assert lut.dtype == np.uint8
+    assert np.abs(lut.astype(np.float64) - expected).max() <= 1
+
+
+def test_gamma_of_one_skips_lookup(tmp_path, monkeypatch):
+    image_path = write_gray_image(tmp_path / "portrait.png", 40, 30)
+
+    def fail_lut(*args, **kwargs):
+        raise AssertionError("cv2.LUT should not run for gamma 1.0")
+
+    monkeypatch.setattr(pre_processing, "GAMMMA", 1.0)
+    monkeypatch.setattr(pre_processing.cv2, "LUT", fail_lut)
+
+    brightness_map = preprocess_image(image_path)
+
+    gray = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+    expected = cv2.resize(gray, (TARGET_WIDTH, int(40 * TARGET_WIDTH / 30)))
+    assert np.array_equal(brightness_map, expected)